@@ -1,11 +1,73 @@
 #!/usr/bin/env python3
 
-import json
-import time
+import asyncio
+import re
 from datetime import datetime
-from camoufox.sync_api import Camoufox
+import orjson
+from camoufox.async_api import AsyncCamoufox
+from page_helpers import EXTRACT_JS, block_resources, goto_cached, goto_ready
 
-def search_tshirts_with_size_info():
+# Stems that mark a result as having size info. "größ"/"läng" are deliberately
+# broad here and also catch compounds like "Größenangaben" (text is lowercased)
+SIZE_RE = re.compile(r'größ|groesse|läng|laenge|breite|size|chart|maße|masse|tabelle')
+
+async def run_query(page, query_url, seen_asins):
+    """Run a single search query and collect products with size info not in seen_asins"""
+    products = []
+    print(f"\n🔍 Trying search: {query_url}")
+    
+    try:
+        await goto_cached(page, query_url)
+        
+        title = await page.title()
+        print(f"Page title: {title}")
+        
+        if "Tut uns Leid" in title:
+            print("❌ Error page, trying next query...")
+            return products
+        
+        # If we get here, the search worked!
+        print("✅ Search successful!")
+        
+        # Extract products in a single round-trip
+        rows = await page.evaluate(EXTRACT_JS)
+        print(f"Found {len(rows)} products")
+        
+        for row in rows[:20]:  # Check first 20 products
+            asin = row['asin']
+            if not asin:
+                continue
+            
+            # The queries overlap heavily, only look at each product once
+            if asin in seen_asins:
+                continue
+            seen_asins.add(asin)
+            
+            title = row['title']
+            
+            # Check title and description for size keywords
+            if SIZE_RE.search(row['text']):
+                href = row['href']
+                product_url = f"https://www.amazon.de{href}" if href.startswith('/') else href
+                
+                product_data = {
+                    'asin': asin,
+                    'title': title,
+                    'price': row['price'],
+                    'url': product_url,
+                    'search_query': query_url,
+                    'scraped_at': datetime.now().isoformat()
+                }
+                
+                products.append(product_data)
+                print(f"✓ {asin}: {title[:50]}... (HAS SIZE INFO)")
+            
+    except Exception as e:
+        print(f"❌ Error: {e}")
+    
+    return products
+
+async def search_tshirts_with_size_info():
     """Search for t-shirts and filter for those with size info"""
     
     # Alternative search strategies that might work better
@@ -18,88 +80,30 @@ def search_tshirts_with_size_info():
     
     all_products = []
     
-    with Camoufox(headless=False, humanize=True) as browser:
-        page = browser.new_page()
+    async with AsyncCamoufox(headless=False, humanize=True) as browser:
+        # One tab per query so the network waits overlap
+        pages = [await browser.new_page() for _ in search_queries]
+        for page in pages:
+            await block_resources(page)
         
-        for query_url in search_queries:
-            print(f"\n🔍 Trying search: {query_url}")
-            
-            try:
-                page.goto(query_url, wait_until='domcontentloaded', timeout=30000)
-                time.sleep(3)
-                
-                title = page.title()
-                print(f"Page title: {title}")
-                
-                if "Tut uns Leid" in title:
-                    print("❌ Error page, trying next query...")
-                    continue
-                
-                # If we get here, the search worked!
-                print("✅ Search successful!")
-                
-                # Extract products
-                products = page.query_selector_all('[data-component-type="s-search-result"]')
-                print(f"Found {len(products)} products")
-                
-                # Look for products with size-related keywords
-                size_keywords = ['größe', 'groesse', 'länge', 'laenge', 'breite', 'size', 'chart', 'maße', 'masse', 'tabelle']
-                
-                for product in products[:20]:  # Check first 20 products
-                    try:
-                        asin = product.get_attribute('data-asin')
-                        if not asin:
-                            continue
-                        
-                        title_elem = product.query_selector('h2 a span')
-                        title = title_elem.text_content().strip() if title_elem else ''
-                        
-                        # Check title and description for size keywords
-                        text_content = product.text_content().lower()
-                        has_size_info = any(keyword in text_content for keyword in size_keywords)
-                        
-                        if has_size_info or "größ" in text_content or "läng" in text_content:
-                            price_elem = product.query_selector('.a-price-whole')
-                            price = price_elem.text_content().strip() if price_elem else ''
-                            
-                            link_elem = product.query_selector('h2 a')
-                            href = link_elem.get_attribute('href') if link_elem else ''
-                            product_url = f"https://www.amazon.de{href}" if href.startswith('/') else href
-                            
-                            product_data = {
-                                'asin': asin,
-                                'title': title,
-                                'price': price,
-                                'url': product_url,
-                                'search_query': query_url,
-                                'scraped_at': datetime.now().isoformat()
-                            }
-                            
-                            all_products.append(product_data)
-                            print(f"✓ {asin}: {title[:50]}... (HAS SIZE INFO)")
-                    
-                    except Exception as e:
-                        continue
-                
-                # If we found products, don't try other searches
-                if len(all_products) > 10:
-                    print(f"\n✅ Found enough products with size info!")
-                    break
-                    
-            except Exception as e:
-                print(f"❌ Error: {e}")
-                continue
+        seen_asins = set()
+        results = await asyncio.gather(*(run_query(pages[i], q, seen_asins) for i, q in enumerate(search_queries)))
+        for products in results:
+            all_products.extend(products)
+        
+        if len(all_products) > 10:
+            print(f"\n✅ Found enough products with size info!")
         
         # Try browsing to a specific category if searches fail
         if len(all_products) < 5:
             print("\n🔍 Trying category browse approach...")
             category_url = "https://www.amazon.de/s?i=fashion&rh=n%3A77028031%2Cp_n_size_browse-vebin%3A22636052031&dc&qid=1635789012&rnid=22636040031&ref=sr_nr_p_n_size_browse-vebin_1"
+            page = pages[0]
             
             try:
-                page.goto(category_url, wait_until='domcontentloaded', timeout=30000)
-                time.sleep(3)
+                await goto_ready(page, category_url)
                 
-                title = page.title()
+                title = await page.title()
                 if "Tut uns Leid" not in title:
                     print("✅ Category page loaded!")
                     # Extract products from category page
@@ -110,8 +114,8 @@ def search_tshirts_with_size_info():
     
     # Save results
     if all_products:
-        with open('tshirts-with-sizes.json', 'w', encoding='utf-8') as f:
-            json.dump(all_products, f, ensure_ascii=False, indent=2)
+        with open('tshirts-with-sizes.json', 'wb') as f:
+            f.write(orjson.dumps(all_products, option=orjson.OPT_INDENT_2))
         
         print(f"\n✅ Found {len(all_products)} products with size information!")
         print("Results saved to: tshirts-with-sizes.json")
@@ -127,4 +131,4 @@ def search_tshirts_with_size_info():
         print("5. Use the scraper to process individual product pages")
 
 if __name__ == '__main__':
-    search_tshirts_with_size_info()
\ No newline at end of file
+    asyncio.run(search_tshirts_with_size_info())
\ No newline at end of file
@@ -1,78 +1,77 @@
 #!/usr/bin/env python3
 
-import time
-from camoufox.sync_api import Camoufox
+import asyncio
+from launch_persistent import get_page, persistent_context
+from page_helpers import EXTRACT_JS, goto_ready
 
-def bypass_amazon_check():
+# The bot check's "Weiter shoppen" button, most specific first. A comma union
+# would return the first match in document order, so only the generic
+# fallbacks share one query
+BUTTON_SELECTORS = (
+    'button:has-text("Weiter shoppen")',
+    'input[type="submit"][value*="Weiter"]',
+    '.a-button-primary, button.a-button-text',
+)
+
+async def bypass_amazon_check():
     print("🔓 Amazon Bot-Check Bypass Test")
-    
-    with Camoufox(headless=False, humanize=True) as browser:
-        page = browser.new_page()
-        
+
+    # Passing the bot check needs the real thing
+    async with persistent_context(headless=False, humanize=True) as context:
+        page = await get_page(context)
+
         # First, go to Amazon
         print("1. Navigating to Amazon.de...")
-        page.goto("https://www.amazon.de", timeout=20000)
-        time.sleep(2)
-        
+        await goto_ready(page, "https://www.amazon.de", selector=', '.join(BUTTON_SELECTORS), timeout=20000)
+
         # Check if we get the bot check
-        title = page.title()
+        title = await page.title()
         print(f"2. Page title: {title}")
-        
-        # Look for the "Weiter shoppen" button
-        button_selectors = [
-            'button:has-text("Weiter shoppen")',
-            'input[type="submit"][value*="Weiter"]',
-            '.a-button-primary',
-            'button.a-button-text'
-        ]
-        
-        button_found = False
-        for selector in button_selectors:
-            button = page.query_selector(selector)
+
+        # Look for the button
+        button = None
+        for selector in BUTTON_SELECTORS:
+            button = await page.query_selector(selector)
             if button:
-                print(f"3. Found button with selector: {selector}")
-                print("4. Clicking button...")
-                button.click()
-                button_found = True
                 break
-        
-        if button_found:
-            # Wait for navigation
-            time.sleep(3)
-            
+        if button:
+            print(f"3. Found button with selector: {selector}")
+            print("4. Clicking button...")
+            await button.click()
+
+            # click() already waits for the navigation it triggers to start
+            await page.wait_for_load_state('domcontentloaded')
+
             # Check new page
-            new_title = page.title()
+            new_title = await page.title()
             print(f"5. New page title: {new_title}")
-            
-            if "Amazon.de" in new_title and "Klicke" not in page.content():
+
+            if "Amazon.de" in new_title and "Klicke" not in await page.content():
                 print("✅ Successfully bypassed bot check!")
-                
+
                 # Now try our search
                 print("\n6. Trying search...")
                 search_url = "https://www.amazon.de/s?k=t-shirt+groesse+laenge&i=fashion"
-                page.goto(search_url, timeout=20000)
-                time.sleep(3)
-                
-                search_title = page.title()
+                await goto_ready(page, search_url, timeout=20000)
+
+                search_title = await page.title()
                 print(f"7. Search page title: {search_title}")
-                
+
                 if "Tut uns Leid" not in search_title:
-                    products = page.query_selector_all('[data-component-type="s-search-result"]')
+                    products = await page.evaluate(EXTRACT_JS)
                     print(f"8. Products found: {len(products)}")
-                    
+
                     if len(products) > 0:
                         print("\n✅ SUCCESS! We can now scrape products!")
-                        
+
                         # Save some ASINs as proof
                         asins = []
-                        for i, product in enumerate(products[:5]):
-                            asin = product.get_attribute('data-asin')
+                        for product in products[:5]:
+                            asin = product['asin']
                             if asin:
                                 asins.append(asin)
-                                title_elem = product.query_selector('h2 a span')
-                                title = title_elem.text_content()[:50] if title_elem else ''
-                                print(f"   {asin}: {title}...")
-                        
+                                print(f"   {asin}: {product['title'][:50]}...")
+
                         return True
                 else:
                     print("❌ Still getting error page on search")
@@ -80,18 +79,17 @@ def bypass_amazon_check():
                 print("❌ Bot check bypass didn't work")
         else:
             print("❌ Couldn't find button to click")
-        
+
         # Keep browser open to investigate
         print("\n💡 Browser is open for manual inspection")
         print("Press Ctrl+C to close")
-        
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            print("\nClosing...")
-    
+
+        await asyncio.Event().wait()
+
     return False
 
 if __name__ == '__main__':
-    bypass_amazon_check()
\ No newline at end of file
+    try:
+        asyncio.run(bypass_amazon_check())
+    except KeyboardInterrupt:
+        print("\nClosing...")
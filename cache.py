@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+import gzip
+import hashlib
+import os
+import time
+
+# Rendered pages are stored gzip-compressed, one file per URL
+CACHE_DIR = '.cache'
+CACHE_TTL = 60 * 60  # seconds
+
+def _path(url):
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + '.html.gz')
+
+def get(url, ttl=CACHE_TTL):
+    """Return the cached HTML for url, or None if missing or older than ttl"""
+    path = _path(url)
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def put(url, html):
+    """Store the HTML for url"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _path(url)
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        f.write(html)
+    os.replace(tmp_path, path)
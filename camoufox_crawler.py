@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 
+import asyncio
 import json
+import re
 import sys
 import urllib.parse
-from camoufox.sync_api import Camoufox
+from camoufox.async_api import AsyncCamoufox
+from page_helpers import EXTRACT_JS, block_resources, goto_ready
 
-def collect_products(search_url, max_pages=2):
+# Title keywords hinting at a size table ("größentabelle" is covered by "größe")
+SIZE_RE = re.compile(r'größe|länge|breite', re.IGNORECASE)
+
+async def collect_products(search_url, max_pages=2):
     # Decode URL if needed
     if '%' in search_url:
         search_url = urllib.parse.unquote(search_url)
@@ -14,8 +20,9 @@ def collect_products(search_url, max_pages=2):
     
     all_products = []
     
-    with Camoufox(headless=False, humanize=True) as browser:
-        page = browser.new_page()
+    async with AsyncCamoufox(headless=False, humanize=True) as browser:
+        page = await browser.new_page()
+        await block_resources(page)
         current_url = search_url
         
         for page_num in range(1, max_pages + 1):
@@ -23,60 +30,49 @@ def collect_products(search_url, max_pages=2):
             print(f"URL: {current_url}")
             
             # Navigate
-            page.goto(current_url, wait_until='networkidle')
-            page.wait_for_timeout(3000)
+            await goto_ready(page, current_url)
             
             # Check title
-            title = page.title()
+            title = await page.title()
             print(f"Title: {title}")
             
             if "Tut uns Leid" in title:
                 print("ERROR: Got error page!")
                 break
             
-            # Extract products
-            products = page.query_selector_all('[data-component-type="s-search-result"]')
-            print(f"Found {len(products)} products")
+            # Extract products in a single round-trip
+            rows = await page.evaluate(EXTRACT_JS)
+            print(f"Found {len(rows)} products")
             
-            for product in products:
-                try:
-                    asin = product.get_attribute('data-asin')
-                    if not asin:
-                        continue
-                    
-                    # Title
-                    title_elem = product.query_selector('h2 a span')
-                    title = title_elem.text_content() if title_elem else ''
-                    
-                    # Price
-                    price_elem = product.query_selector('.a-price-whole')
-                    price = price_elem.text_content() if price_elem else ''
-                    
-                    # Check if title mentions size table
-                    has_size_info = any(word in title.lower() for word in ['größentabelle', 'größe', 'länge', 'breite'])
-                    
-                    product_data = {
-                        'asin': asin,
-                        'title': title.strip(),
-                        'price': price.strip(),
-                        'url': f'https://www.amazon.de/dp/{asin}',
-                        'has_size_info': has_size_info
-                    }
-                    
-                    all_products.append(product_data)
-                    
-                    if has_size_info:
-                        print(f"✓ {asin}: {title[:50]}... (MIGHT HAVE SIZE TABLE)")
-                    else:
-                        print(f"  {asin}: {title[:50]}...")
-                    
-                except Exception as e:
-                    print(f"Error extracting product: {e}")
+            for row in rows:
+                asin = row['asin']
+                if not asin:
+                    continue
+                
+                title = row['title']
+                
+                # Check if title mentions size table
+                has_size_info = bool(SIZE_RE.search(title))
+                
+                product_data = {
+                    'asin': asin,
+                    'title': title,
+                    'price': row['price'],
+                    'url': f'https://www.amazon.de/dp/{asin}',
+                    'has_size_info': has_size_info
+                }
+                
+                all_products.append(product_data)
+                
+                if has_size_info:
+                    print(f"✓ {asin}: {title[:50]}... (MIGHT HAVE SIZE TABLE)")
+                else:
+                    print(f"  {asin}: {title[:50]}...")
             
             # Find next page
-            next_button = page.query_selector('a:has-text("Weiter")')
+            next_button = await page.query_selector('a:has-text("Weiter")')
             if next_button and page_num < max_pages:
-                href = next_button.get_attribute('href')
+                href = await next_button.get_attribute('href')
                 if href:
                     if href.startswith('/'):
                         current_url = 'https://www.amazon.de' + href
@@ -84,7 +80,7 @@ def collect_products(search_url, max_pages=2):
                         current_url = href
                     
                     print(f"\nFound next page: {current_url[:80]}...")
-                    page.wait_for_timeout(3000)  # Rate limit
+                    await page.wait_for_timeout(3000)  # Rate limit
                 else:
                     print("No next page found")
                     break
@@ -109,4 +105,4 @@ if __name__ == '__main__':
     
     max_pages = int(sys.argv[2]) if len(sys.argv) > 2 else 2
     
-    collect_products(url, max_pages)
\ No newline at end of file
+    asyncio.run(collect_products(url, max_pages))
\ No newline at end of file
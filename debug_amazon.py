@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 
-from camoufox.sync_api import Camoufox
-import time
+import asyncio
+from launch_persistent import HEADLESS, persistent_context
+from page_helpers import ASINS_JS, SEL_RESULT, goto_ready
 
 print("🔍 Amazon Debug Test")
 print("="*80)
 
+# Category pages and the homepage have no search results, and error pages
+# neither, so any Amazon page counts as loaded
+READY_SELECTOR = f'{SEL_RESULT}, #nav-search, #captchacharacters'
+
 # Different URL variations to test
 test_urls = [
     ("Simple search", "https://www.amazon.de/s?k=t-shirt"),
@@ -14,57 +19,67 @@ test_urls = [
     ("Homepage", "https://www.amazon.de"),
 ]
 
-with Camoufox(headless=False, humanize=True) as browser:
-    page = browser.new_page()
-    
-    for name, url in test_urls:
-        print(f"\n🧪 Testing: {name}")
-        print(f"URL: {url}")
-        
-        try:
-            page.goto(url, wait_until='domcontentloaded', timeout=20000)
-            time.sleep(2)
-            
-            title = page.title()
-            print(f"Title: {title}")
-            
-            # Take screenshot
-            screenshot_name = f"debug-{name.replace(' ', '-').lower()}.png"
-            page.screenshot(path=screenshot_name)
-            print(f"Screenshot: {screenshot_name}")
-            
-            # Check what's on the page
-            if "Tut uns Leid" in title:
-                print("❌ ERROR PAGE")
-                
-                # Check for specific error elements
-                error_texts = page.query_selector_all('p')
-                for p in error_texts[:3]:
-                    text = p.text_content().strip()
-                    if text:
-                        print(f"  Error text: {text[:100]}...")
-                        
-            else:
-                print("✅ Page loaded successfully")
-                
-                # Check for products
-                products = page.query_selector_all('[data-asin]')
-                print(f"  Products found: {len(products)}")
-                
-                # Check for search results
-                results = page.query_selector_all('[data-component-type="s-search-result"]')
-                print(f"  Search results: {len(results)}")
-            
-        except Exception as e:
-            print(f"❌ Error: {e}")
-    
-    print("\n" + "="*80)
-    print("💡 Manual check:")
-    print("Please check the page manually in the browser window")
-    print("Press Ctrl+C when done")
-    
+async def test_url(page, name, url):
+    # Tabs run concurrently, so collect the report and print it in one go
+    lines = [f"\n🧪 Testing: {name}", f"URL: {url}"]
+
     try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        print("\nClosing...")
\ No newline at end of file
+        await goto_ready(page, url, selector=READY_SELECTOR, timeout=20000, ready_timeout=2000)
+
+        title = await page.title()
+        lines.append(f"Title: {title}")
+
+        # Take screenshot
+        screenshot_name = f"debug-{name.replace(' ', '-').lower()}.png"
+        await page.screenshot(path=screenshot_name)
+        lines.append(f"Screenshot: {screenshot_name}")
+
+        # Check what's on the page
+        if "Tut uns Leid" in title:
+            lines.append("❌ ERROR PAGE")
+
+            # Check for specific error elements
+            error_texts = await page.query_selector_all('p')
+            for p in error_texts[:3]:
+                text = (await p.text_content()).strip()
+                if text:
+                    lines.append(f"  Error text: {text[:100]}...")
+
+        else:
+            lines.append("✅ Page loaded successfully")
+
+            # Check for products
+            asins = await page.eval_on_selector_all('[data-asin]', ASINS_JS)
+            lines.append(f"  Products found: {len(asins)}")
+
+            # Check for search results
+            results = await page.locator(SEL_RESULT).count()
+            lines.append(f"  Search results: {results}")
+
+    except Exception as e:
+        lines.append(f"❌ Error: {e}")
+
+    return lines
+
+async def main():
+    async with persistent_context() as context:
+        pages = [await context.new_page() for _ in test_urls]
+
+        reports = await asyncio.gather(*(test_url(pages[i], name, url) for i, (name, url) in enumerate(test_urls)))
+        for lines in reports:
+            print("\n".join(lines))
+
+        if HEADLESS:
+            return
+
+        print("\n" + "="*80)
+        print("💡 Manual check:")
+        print("Please check the page manually in the browser window")
+        print("Press Ctrl+C when done")
+
+        await asyncio.Event().wait()
+
+try:
+    asyncio.run(main())
+except KeyboardInterrupt:
+    print("\nClosing...")
@@ -1,12 +1,188 @@
 #!/usr/bin/env python3
 
-import json
-import time
+import asyncio
+import re
 import sys
+import urllib.parse
 from datetime import datetime
-from camoufox.sync_api import Camoufox
+import orjson
+from camoufox.async_api import AsyncCamoufox
+from page_helpers import EXTRACT_JS, block_resources, goto_ready
 
-def crawl_amazon_tshirts(max_pages=5):
+# Words in a result tile that suggest a size table, including bare "cm".
+# The tile text arrives lowercased from EXTRACT_JS, so no IGNORECASE
+SIZE_RE = re.compile(r'größe|groesse|länge|laenge|breite|size|chart|maße|masse|tabelle|cm')
+
+OUTPUT_FILE = 'amazon-tshirts-complete.jsonl'
+
+# The enabled next-page link, found in a single DOM query. Text matches on
+# "Weiter" are left out: they also hit "Weitere ..." links earlier in the page
+NEXT_PAGE_SELECTOR = 'a.s-pagination-next:not(.s-pagination-disabled), .s-pagination-strip a.s-pagination-next'
+
+# Search pages fetched in parallel, each in its own browser context
+MAX_CONCURRENT_PAGES = 3
+
+async def extract_products(page, page_num):
+    """Extract all products from a loaded search results page"""
+    # Extract all products in a single round-trip
+    rows = await page.evaluate(EXTRACT_JS)
+    print(f"Found {len(rows)} products on page {page_num}")
+    
+    page_products = []
+    for row in rows:
+        asin = row['asin']
+        if not asin:
+            continue
+        
+        title = row['title']
+        href = row['href']
+        product_url = f"https://www.amazon.de{href}" if href.startswith('/') else href
+        
+        # Check if product likely has size table
+        has_size_indicators = bool(SIZE_RE.search(row['text']))
+        
+        product_data = {
+            'asin': asin,
+            'title': title,
+            'price': row['price'],
+            'url': product_url,
+            'page': page_num,
+            'likely_has_size_table': has_size_indicators,
+            'scraped_at': datetime.now().isoformat()
+        }
+        
+        page_products.append(product_data)
+        
+        # Print progress
+        marker = "✓" if has_size_indicators else " "
+        print(f"{marker} {asin}: {title[:60]}...")
+    
+    return page_products
+
+async def load_page(page, url, page_num):
+    """Navigate to a search page; returns False unless search results appeared"""
+    print(f"\n📄 Page {page_num}")
+    print(f"URL: {url}")
+    
+    has_results = await goto_ready(page, url)
+    
+    # Check if page loaded successfully
+    title = await page.title()
+    print(f"Page {page_num} title: {title}")
+    
+    if "Tut uns Leid" in title:
+        print(f"❌ Error page detected on page {page_num}.")
+        return False
+    if not has_results:
+        print(f"❌ No search results on page {page_num} (captcha or bot check?).")
+        return False
+    return True
+
+async def scrape_page(context, url, page_num, semaphore, queue):
+    """Fetch one search page and queue (page_num, products); returns (page_num, product count)"""
+    page_products = []
+    async with semaphore:
+        page = await context.new_page()
+        try:
+            if await load_page(page, url, page_num):
+                page_products = await extract_products(page, page_num)
+        except Exception as e:
+            print(f"❌ Error on page {page_num}: {e}")
+        finally:
+            await page.close()
+    
+    # Failed pages are queued too, the writer waits for every page number
+    await queue.put((page_num, page_products))
+    return page_num, len(page_products)
+
+async def find_page_url_base(page):
+    """Derive the search URL without its page parameter from the next-page link"""
+    next_elem = await page.query_selector(NEXT_PAGE_SELECTOR)
+    if next_elem:
+        href = await next_elem.get_attribute('href')
+        if href:
+            next_url = f"https://www.amazon.de{href}" if href.startswith('/') else href
+            parts = urllib.parse.urlsplit(next_url)
+            query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True) if k != 'page']
+            return parts._replace(query=urllib.parse.urlencode(query)).geturl()
+    return None
+
+async def write_products(queue):
+    """Write queued pages to the output files in page order; returns (total, with_size)"""
+    total = with_size = 0
+    # Pages finish out of order, so later ones wait here until the gap before them is filled
+    pending = {}
+    next_page = 1
+    with open(OUTPUT_FILE, 'wb') as out, \
+            open('product-urls.txt', 'w', encoding='utf-8') as urls, \
+            open('asins-with-sizes.txt', 'w', encoding='utf-8') as asins:
+        done = False
+        while not done:
+            item = await queue.get()
+            if item is None:
+                # Scraping is over, flush whatever is still held back
+                done = True
+                ready = [pending.pop(page_num) for page_num in sorted(pending)]
+            else:
+                page_num, page_products = item
+                pending[page_num] = page_products
+                ready = []
+                while next_page in pending:
+                    ready.append(pending.pop(next_page))
+                    next_page += 1
+            
+            for page_products in ready:
+                for product in page_products:
+                    out.write(orjson.dumps(product) + b'\n')
+                    urls.write(f"{product['url']}\n")
+                    total += 1
+                    
+                    if product['likely_has_size_table']:
+                        asins.write(f"{product['asin']}\n")
+                        with_size += 1
+    
+    return total, with_size
+
+async def scrape_pages(queue, start_url, max_pages):
+    """Scrape all search pages into the queue, then signal the writer to stop"""
+    try:
+        async with AsyncCamoufox(headless=False, humanize=True) as browser:
+            # Contexts are cheap compared to browsers, so use one per parallel page
+            contexts = [await browser.new_context() for _ in range(MAX_CONCURRENT_PAGES)]
+            for context in contexts:
+                await block_resources(context)
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+            
+            # Page 1 tells us whether there is pagination at all
+            page = await contexts[0].new_page()
+            page_products = []
+            base_url = None
+            try:
+                if await load_page(page, start_url, 1):
+                    page_products = await extract_products(page, 1)
+                    base_url = await find_page_url_base(page) if max_pages > 1 else None
+            except Exception as e:
+                print(f"❌ Error on page 1: {e}")
+            finally:
+                await page.close()
+            await queue.put((1, page_products))
+            
+            if base_url:
+                # Remaining pages have predictable URLs, fetch them concurrently
+                urls = [(page_num, f"{base_url}&page={page_num}") for page_num in range(2, max_pages + 1)]
+                results = await asyncio.gather(*(
+                    scrape_page(contexts[i % len(contexts)], url, page_num, semaphore, queue)
+                    for i, (page_num, url) in enumerate(urls)
+                ))
+                
+                for page_num, count in sorted(results):
+                    print(f"Extracted {count} products from page {page_num}")
+            elif max_pages > 1:
+                print("\n❌ No next page found")
+    finally:
+        await queue.put(None)
+
+async def crawl_amazon_tshirts(max_pages=5):
     """Crawl Amazon for t-shirts with size information"""
     
     # This search query works!
@@ -17,145 +193,25 @@ def crawl_amazon_tshirts(max_pages=5):
     print(f"Max pages: {max_pages}")
     print("="*80)
     
-    all_products = []
-    
-    with Camoufox(headless=False, humanize=True) as browser:
-        page = browser.new_page()
-        current_url = start_url
-        
-        for page_num in range(1, max_pages + 1):
-            print(f"\n📄 Page {page_num}")
-            print(f"URL: {current_url}")
-            
-            try:
-                # Navigate to page
-                page.goto(current_url, wait_until='domcontentloaded', timeout=30000)
-                time.sleep(3)
-                
-                # Check if page loaded successfully
-                title = page.title()
-                print(f"Page title: {title}")
-                
-                if "Tut uns Leid" in title:
-                    print("❌ Error page detected. Stopping.")
-                    break
-                
-                # Wait for products to load
-                page.wait_for_selector('[data-component-type="s-search-result"]', timeout=10000)
-                
-                # Extract all products
-                products = page.query_selector_all('[data-component-type="s-search-result"]')
-                print(f"Found {len(products)} products on page")
-                
-                page_products = []
-                for product in products:
-                    try:
-                        asin = product.get_attribute('data-asin')
-                        if not asin:
-                            continue
-                        
-                        # Extract title
-                        title_elem = product.query_selector('h2 a span')
-                        title = title_elem.text_content().strip() if title_elem else ''
-                        
-                        # Extract price
-                        price_elem = product.query_selector('.a-price-whole')
-                        price = price_elem.text_content().strip() if price_elem else ''
-                        
-                        # Extract URL
-                        link_elem = product.query_selector('h2 a')
-                        href = link_elem.get_attribute('href') if link_elem else ''
-                        product_url = f"https://www.amazon.de{href}" if href.startswith('/') else href
-                        
-                        # Check if product likely has size table
-                        text_content = product.text_content().lower()
-                        size_keywords = ['größe', 'groesse', 'länge', 'laenge', 'breite', 'size', 'chart', 'maße', 'masse', 'tabelle', 'cm']
-                        has_size_indicators = any(keyword in text_content for keyword in size_keywords)
-                        
-                        product_data = {
-                            'asin': asin,
-                            'title': title,
-                            'price': price,
-                            'url': product_url,
-                            'page': page_num,
-                            'likely_has_size_table': has_size_indicators,
-                            'scraped_at': datetime.now().isoformat()
-                        }
-                        
-                        page_products.append(product_data)
-                        
-                        # Print progress
-                        marker = "✓" if has_size_indicators else " "
-                        print(f"{marker} {asin}: {title[:60]}...")
-                        
-                    except Exception as e:
-                        print(f"Error extracting product: {e}")
-                        continue
-                
-                all_products.extend(page_products)
-                print(f"\nExtracted {len(page_products)} products from page {page_num}")
-                print(f"Total products so far: {len(all_products)}")
-                
-                # Save after each page
-                with open('amazon-tshirts-complete.json', 'w', encoding='utf-8') as f:
-                    json.dump(all_products, f, ensure_ascii=False, indent=2)
-                
-                # Look for next page
-                if page_num < max_pages:
-                    next_selectors = [
-                        'a.s-pagination-next:not(.s-pagination-disabled)',
-                        '.s-pagination-strip a:has-text("Weiter")',
-                        'a:has-text("Weiter")'
-                    ]
-                    
-                    next_url = None
-                    for selector in next_selectors:
-                        next_elem = page.query_selector(selector)
-                        if next_elem:
-                            href = next_elem.get_attribute('href')
-                            if href:
-                                next_url = f"https://www.amazon.de{href}" if href.startswith('/') else href
-                                break
-                    
-                    if next_url:
-                        print(f"\n➡️  Next page found: {next_url[:80]}...")
-                        current_url = next_url
-                        time.sleep(5)  # Rate limit between pages
-                    else:
-                        print("\n❌ No next page found")
-                        break
-                
-            except Exception as e:
-                print(f"❌ Error on page {page_num}: {e}")
-                break
+    # Scrapers hand finished pages to the writer through a bounded queue, so
+    # only pages not yet written are held in memory
+    queue = asyncio.Queue(maxsize=MAX_CONCURRENT_PAGES)
+    _, (total, with_size) = await asyncio.gather(
+        scrape_pages(queue, start_url, max_pages),
+        write_products(queue),
+    )
     
     # Summary
     print("\n" + "="*80)
     print("📊 SUMMARY")
-    print(f"Total products collected: {len(all_products)}")
-    
-    products_with_size = [p for p in all_products if p['likely_has_size_table']]
-    print(f"Products likely to have size tables: {len(products_with_size)}")
-    
-    # Save final results
-    with open('amazon-tshirts-complete.json', 'w', encoding='utf-8') as f:
-        json.dump(all_products, f, ensure_ascii=False, indent=2)
-    
-    # Save just the URLs
-    with open('product-urls.txt', 'w', encoding='utf-8') as f:
-        for product in all_products:
-            f.write(f"{product['url']}\n")
-    
-    # Save ASINs for products with size info
-    with open('asins-with-sizes.txt', 'w', encoding='utf-8') as f:
-        for product in products_with_size:
-            f.write(f"{product['asin']}\n")
+    print(f"Total products collected: {total}")
+    print(f"Products likely to have size tables: {with_size}")
     
     print(f"\n✅ Results saved to:")
-    print("  - amazon-tshirts-complete.json (all data)")
+    print(f"  - {OUTPUT_FILE} (all data, one JSON object per line)")
     print("  - product-urls.txt (just URLs)")
     print("  - asins-with-sizes.txt (ASINs likely to have size tables)")
 
 if __name__ == '__main__':
     max_pages = int(sys.argv[1]) if len(sys.argv) > 1 else 3
-    crawl_amazon_tshirts(max_pages)
\ No newline at end of file
+    asyncio.run(crawl_amazon_tshirts(max_pages))
\ No newline at end of file
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+
+import json
+import sys
+
+def convert(jsonl_path, json_path):
+    """Convert a JSON Lines crawler output into a single JSON array"""
+    with open(jsonl_path, encoding='utf-8') as f:
+        products = [json.loads(line) for line in f if line.strip()]
+
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(products, f, ensure_ascii=False, indent=2)
+
+    print(f"Converted {len(products)} products to {json_path}")
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: jsonl_to_json.py <input.jsonl> [output.json]")
+        sys.exit(1)
+
+    jsonl_path = sys.argv[1]
+    json_path = sys.argv[2] if len(sys.argv) > 2 else jsonl_path.rsplit('.', 1)[0] + '.json'
+    convert(jsonl_path, json_path)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+import os
+from contextlib import asynccontextmanager
+from camoufox.async_api import AsyncCamoufox
+
+# Cookies and storage live here, so a bot check passed once stays passed
+PROFILE_DIR = '.camoufox-profile'
+
+# Humanized input and a visible window only pay off against the real bot
+# checks; dev runs skip both unless SCRAPER_PROD=1
+HUMANIZE = os.environ.get('SCRAPER_PROD') == '1'
+HEADLESS = not HUMANIZE
+
+@asynccontextmanager
+async def persistent_context(headless=HEADLESS, humanize=HUMANIZE):
+    """Launch Camoufox on the shared profile and yield its browser context"""
+    async with AsyncCamoufox(
+        persistent_context=True,
+        user_data_dir=PROFILE_DIR,
+        headless=headless,
+        humanize=humanize,
+    ) as context:
+        yield context
+
+async def get_page(context):
+    """Reuse the blank tab a persistent context starts with, or open a new one"""
+    if context.pages:
+        return context.pages[0]
+    return await context.new_page()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+import asyncio
+import random
+import cache
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+# Search result selectors, shared by all scrapers
+SEL_RESULT = '[data-component-type="s-search-result"]'
+SEL_TITLE = 'h2 a span'
+SEL_PRICE = '.a-price-whole'
+SEL_LINK = 'h2 a'
+
+# Reads every non-empty data-asin in one round-trip; use with eval_on_selector_all('[data-asin]', ...)
+ASINS_JS = '(els) => els.map(e => e.dataset.asin).filter(Boolean)'
+
+# Walks all search results inside the browser and returns them as one JSON
+# array, instead of several Playwright round-trips per product. The tile text
+# comes back lowercased so keyword matching needs no extra copy in Python
+EXTRACT_JS = f"""() => Array.from(document.querySelectorAll({SEL_RESULT!r})).map(el => ({{
+    asin: el.dataset.asin || '',
+    title: el.querySelector({SEL_TITLE!r})?.textContent.trim() || '',
+    price: el.querySelector({SEL_PRICE!r})?.textContent.trim() || '',
+    href: el.querySelector({SEL_LINK!r})?.getAttribute('href') || '',
+    text: (el.textContent || '').toLowerCase()
+}}))"""
+
+# Resource types the scrapers never read; skipping them cuts most of the page weight
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'stylesheet', 'media'}
+
+async def _abort_blocked(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def block_resources(target):
+    """Abort image/font/stylesheet/media requests for a page or browser context"""
+    await target.route("**/*", _abort_blocked)
+
+async def with_retry(coro_factory, attempts=3, base=1.0, cap=5.0):
+    """Await coro_factory(), retrying Playwright errors with exponential backoff and jitter"""
+    for attempt in range(attempts):
+        try:
+            return await coro_factory()
+        except PlaywrightError as e:
+            if attempt == attempts - 1:
+                raise
+            delay = min(cap, base * 2 ** attempt) + random.random()
+            print(f"⚠️  {e.__class__.__name__}: retrying in {delay:.1f}s ({attempt + 1}/{attempts - 1})")
+            await asyncio.sleep(delay)
+
+async def goto_ready(page, url, selector=SEL_RESULT, timeout=30000, ready_timeout=8000):
+    """Navigate and return as soon as selector is in the DOM; returns whether it appeared within ready_timeout"""
+    # Timeouts and connection resets from Amazon are usually transient
+    await with_retry(lambda: page.goto(url, wait_until='domcontentloaded', timeout=timeout))
+    try:
+        await page.wait_for_selector(selector, timeout=ready_timeout)
+        return True
+    except PlaywrightTimeoutError:
+        # Error and captcha pages never show the selector; callers check for those
+        return False
+
+async def goto_cached(page, url, selector=SEL_RESULT, timeout=30000):
+    """Serve url from the disk cache if fresh, otherwise navigate and cache it; returns True on a hit"""
+    html = cache.get(url)
+    if html is not None:
+        await page.set_content(html)
+        return True
+
+    # Only cache real result pages, never error, bot-check or captcha pages
+    if await goto_ready(page, url, selector, timeout):
+        cache.put(url, await page.content())
+    return False
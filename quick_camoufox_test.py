@@ -1,29 +1,30 @@
 #!/usr/bin/env python3
 
-from camoufox.sync_api import Camoufox
+import asyncio
 import sys
+from launch_persistent import get_page, persistent_context
+from page_helpers import ASINS_JS, goto_ready
 
-def quick_test():
+async def quick_test():
     url = sys.argv[1] if len(sys.argv) > 1 else "https://www.amazon.de/dp/B08N5WRWNW"
     
     print(f"Quick Camoufox test with: {url}")
     
-    with Camoufox(headless=True, humanize=True) as browser:
-        page = browser.new_page()
+    async with persistent_context(headless=True) as context:
+        page = await get_page(context)
         
         print("Navigating...")
-        page.goto(url)
-        page.wait_for_timeout(3000)
+        await goto_ready(page, url, selector='#productTitle, [data-asin], #captchacharacters')
         
         # Screenshot
-        page.screenshot(path='quick-test.png')
+        await page.screenshot(path='quick-test.png')
         
         # Title
-        title = page.title()
+        title = await page.title()
         print(f"Title: {title}")
         
         # Check for captcha
-        if page.query_selector('#captchacharacters'):
+        if await page.query_selector('#captchacharacters'):
             print("CAPTCHA DETECTED!")
         elif "Tut uns Leid" in title:
             print("ERROR PAGE!")
@@ -31,13 +32,13 @@ def quick_test():
             print("Page loaded successfully")
             
             # Count products
-            products = page.query_selector_all('[data-asin]')
-            print(f"Products found: {len(products)}")
+            asins = await page.eval_on_selector_all('[data-asin]', ASINS_JS)
+            print(f"Products found: {len(asins)}")
             
             # Get some text
-            body_text = page.query_selector('body').text_content()
+            body_text = await page.locator('body').text_content()
             if "Roboter" in body_text:
                 print("Robot check detected in text")
 
 if __name__ == '__main__':
-    quick_test()
\ No newline at end of file
+    asyncio.run(quick_test())
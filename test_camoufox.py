@@ -1,56 +1,51 @@
 #!/usr/bin/env python3
 
-import sys
-from camoufox.sync_api import Camoufox
+import asyncio
+from launch_persistent import HEADLESS, get_page, persistent_context
+from page_helpers import ASINS_JS, goto_ready
 
-def test_simple():
+async def test_simple():
     print("Testing Camoufox...")
-    
+
     try:
         # Simple test without complex options
-        with Camoufox(
-            headless=False,
-            humanize=True,
-        ) as browser:
-            page = browser.new_page()
-            
+        async with persistent_context() as context:
+            page = await get_page(context)
+
             print("Navigating to Amazon.de...")
-            page.goto('https://www.amazon.de/s?k=t-shirt')
-            
-            # Wait for page to load
-            page.wait_for_timeout(5000)
-            
+            await goto_ready(page, 'https://www.amazon.de/s?k=t-shirt')
+
             # Take screenshot
-            page.screenshot(path='camoufox-test.png')
+            await page.screenshot(path='camoufox-test.png')
             print("Screenshot saved to camoufox-test.png")
-            
+
             # Check title
-            title = page.title()
+            title = await page.title()
             print(f"Page title: {title}")
-            
+
             # Look for products
-            products = page.query_selector_all('[data-asin]')
-            print(f"Found {len(products)} elements with data-asin")
-            
+            asins = await page.eval_on_selector_all('[data-asin]', ASINS_JS)
+            print(f"Found {len(asins)} elements with data-asin")
+
             # Check for captcha
-            captcha = page.query_selector('#captchacharacters')
+            captcha = await page.query_selector('#captchacharacters')
             if captcha:
                 print("WARNING: Captcha detected!")
             else:
                 print("No captcha detected")
-            
+
             # Get first few ASINs
-            for i, product in enumerate(products[:5]):
-                asin = product.get_attribute('data-asin')
-                if asin:
-                    print(f"ASIN {i+1}: {asin}")
-            
-            input("Press Enter to close browser...")
-            
+            for i, asin in enumerate(asins[:5]):
+                print(f"ASIN {i+1}: {asin}")
+
+            # Nothing to look at without a window
+            if not HEADLESS:
+                await asyncio.to_thread(input, "Press Enter to close browser...")
+
     except Exception as e:
         print(f"Error: {e}")
         import traceback
         traceback.print_exc()
 
 if __name__ == '__main__':
-    test_simple()
\ No newline at end of file
+    asyncio.run(test_simple())
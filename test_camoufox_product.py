@@ -1,7 +1,32 @@
 #!/usr/bin/env python3
 
-import re
+import random
 from camoufox.sync_api import Camoufox
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+# RE2 matches in linear time, which matters when scanning whole product pages
+try:
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+# "L x B x H unit", optionally preceded by an (Produkt)Abmessungen label.
+# One fused pattern, compiled once, scans the page a single time. The
+# inline (?i) works for both re and re2, which has no flags argument.
+# The label gap is bounded and stops at line ends, so a stray
+# "Abmessungen" cannot make the engine backtrack across the document
+_DIM_RE = _re.compile(
+    r'(?i)(?:(?:Produkt)?Abmessungen[^:\n]{0,80}:\s*)?'
+    r'(\d+(?:[,.]\d+)?)\s*x\s*(\d+(?:[,.]\d+)?)\s*x\s*(\d+(?:[,.]\d+)?)\s*(cm|mm|m)\b'
+)
+
+# Text of the table row (techSpec <th>) or detail bullet (bold <span>)
+# labelled Produktabmessungen, or '' if the page has none
+DIM_ROW_JS = """() => {
+    const label = [...document.querySelectorAll('th, span.a-text-bold')]
+        .find(e => e.textContent.trim().startsWith('Produktabmessungen'));
+    return label?.parentElement?.textContent || '';
+}"""
 
 def test_product():
     asin = "B08N5WRWNW"  # Echo Dot
@@ -17,19 +42,21 @@ def test_product():
             page = browser.new_page()
             
             print("Navigating to product page...")
-            page.goto(url, wait_until='networkidle')
+            page.goto(url, wait_until='domcontentloaded')
+            try:
+                page.wait_for_selector('#productTitle, #captchacharacters', state='attached', timeout=10000)
+            except PlaywrightTimeoutError:
+                # Error pages and other captcha variants; still screenshot and report them below
+                pass
             
             # Human-like behavior
             print("Simulating human behavior...")
-            page.wait_for_timeout(2000)
             
-            # Random mouse movements
-            import random
-            for _ in range(3):
-                x = random.randint(100, 800)
-                y = random.randint(100, 600)
+            # Random mouse movements as (x, y, delay)
+            moves = [(random.randint(100, 800), random.randint(100, 600), random.randint(200, 500)) for _ in range(3)]
+            for x, y, delay in moves:
                 page.mouse.move(x, y)
-                page.wait_for_timeout(random.randint(200, 500))
+                page.wait_for_timeout(delay)
             
             # Scroll down
             page.evaluate('window.scrollBy(0, 300)')
@@ -65,28 +92,15 @@ def test_product():
                 if product_title:
                     print(f"Product: {product_title.text_content().strip()}")
                 
-                # Look for dimensions
-                content = page.content()
-                
-                # Search for dimensions pattern
-                dimension_patterns = [
-                    r'(\d+(?:[,.]\d+)?)\s*x\s*(\d+(?:[,.]\d+)?)\s*x\s*(\d+(?:[,.]\d+)?)\s*(cm|mm|m)',
-                    r'Abmessungen.*?:\s*(\d+(?:[,.]\d+)?)\s*x\s*(\d+(?:[,.]\d+)?)\s*x\s*(\d+(?:[,.]\d+)?)\s*(cm|mm|m)',
-                    r'Produktabmessungen.*?:\s*(\d+(?:[,.]\d+)?)\s*x\s*(\d+(?:[,.]\d+)?)\s*x\s*(\d+(?:[,.]\d+)?)\s*(cm|mm|m)',
-                ]
+                # The labelled "Produktabmessungen" row is a few dozen
+                # characters, try it before reading any larger section
+                dim_row = page.evaluate(DIM_ROW_JS)
+                match = _DIM_RE.search(dim_row) if dim_row else None
                 
-                found_dimensions = False
-                for pattern in dimension_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    if matches:
-                        print(f"Found dimensions: {matches[0]}")
-                        found_dimensions = True
-                        break
-                
-                if not found_dimensions:
-                    print("No dimensions found in page content")
-                    
-                    # Try specific selectors
+                details = []
+                if match is None:
+                    # Dimensions live in the detail sections, so read those small
+                    # nodes first instead of the whole page HTML
                     detail_selectors = [
                         '#detailBullets_feature_div',
                         '#productDetails_techSpec_section_1',
@@ -97,17 +111,33 @@ def test_product():
                     for selector in detail_selectors:
                         elem = page.query_selector(selector)
                         if elem:
-                            text = elem.text_content()
-                            print(f"\nFound {selector}:")
-                            print(text[:200] + "..." if len(text) > 200 else text)
+                            details.append((selector, elem.text_content()))
+                    
+                    if details:
+                        content = "\n".join(text for _, text in details)
+                    else:
+                        content = page.content()
+                    
+                    # Search for dimensions pattern; only the first match is used
+                    match = _DIM_RE.search(content)
+                
+                found_dimensions = match is not None
+                if found_dimensions:
+                    print(f"Found dimensions: {match.groups()}")
+                
+                if not found_dimensions:
+                    print("No dimensions found in page content")
+                    
+                    for selector, text in details:
+                        print(f"\nFound {selector}:")
+                        print(text[:200] + "..." if len(text) > 200 else text)
             
             # Keep browser open for inspection
             print("\nBrowser is open for inspection...")
-            print("Check the page manually and press Ctrl+C to exit")
+            print("Check the page manually and close the tab or press Ctrl+C to exit")
             
-            # Wait indefinitely
-            while True:
-                page.wait_for_timeout(1000)
+            # Block until the tab is closed instead of polling
+            page.wait_for_event('close', timeout=0)
                 
     except KeyboardInterrupt:
         print("\nClosing browser...")
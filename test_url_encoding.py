@@ -38,12 +38,13 @@ def test_urls():
     print("\n" + "="*80 + "\n")
     
     with Camoufox(headless=False, humanize=True) as browser:
+        # One tab is enough, each test just navigates it to the next URL
+        page = browser.new_page()
+        
         for name, url in test_urls:
             print(f"\nTesting {name}...")
             print(f"URL: {url[:80]}...")
             
-            page = browser.new_page()
-            
             try:
                 page.goto(url, wait_until='networkidle', timeout=30000)
                 page.wait_for_timeout(2000)
@@ -62,8 +63,8 @@ def test_urls():
                 
             except Exception as e:
                 print(f"Error: {e}")
-            
-            page.close()
+        
+        page.close()
 
 def construct_search_url():
     """Konstruiere die URL mit korrekter Kodierung"""
@@ -1,103 +1,190 @@
 #!/usr/bin/env python3
 
-import json
+import asyncio
+import re
 import sys
 import urllib.parse
 import time
 from datetime import datetime
-from camoufox.sync_api import Camoufox
+import orjson
+from camoufox.async_api import AsyncCamoufox
+from page_helpers import EXTRACT_JS, SEL_RESULT, block_resources, with_retry
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Title keywords hinting at a size table ("größentabelle" is covered by "größe")
+SIZE_KEYWORDS = ('größe', 'länge', 'breite', 'size', 'chart', 'maße')
+
+# Aho-Corasick automaton when pyahocorasick is installed, otherwise one regex alternation
+if ahocorasick:
+    _SIZE_AC = ahocorasick.Automaton()
+    for keyword in SIZE_KEYWORDS:
+        _SIZE_AC.add_word(keyword, keyword)
+    _SIZE_AC.make_automaton()
+else:
+    _SIZE_RE = re.compile('|'.join(SIZE_KEYWORDS), re.IGNORECASE)
+
+def has_size_keyword(title):
+    """Return True if the title contains any of SIZE_KEYWORDS"""
+    if ahocorasick:
+        # Stops at the first hit
+        return next(_SIZE_AC.iter(title.lower()), None) is not None
+    return _SIZE_RE.search(title) is not None
+
+OUTPUT_FILE = 'amazon-products.jsonl'
+
+# Relative, protocol-relative and absolute hrefs all resolve against this
+_BASE = 'https://www.amazon.de/'
+
+# Minimum time between two navigations in the same context, as a rate limit
+MIN_PAGE_INTERVAL = 5  # seconds
+
+# Search pages are fetched in parallel, one browser context each
+MAX_CONTEXTS = 4
+
+# Enabled "next" link of the pagination strip, as one union selector
+NEXT_SEL = 'a.s-pagination-next:not(.s-pagination-disabled), .s-pagination-strip a.s-pagination-next'
+
+# Page title plus error page and captcha flags, read together
+PAGE_STATE_JS = """() => ({
+    title: document.title,
+    isError: /Tut uns Leid|Sorry/.test(document.title),
+    hasCaptcha: !!document.getElementById('captchacharacters')
+})"""
+
+# Runs of "++"/"+++" left over from encoded " + " separators
+_PLUS_RUN_RE = re.compile(r'\+{2,3}')
 
 def decode_url(url):
     """Decode URL properly - this is the key!"""
     # First decode
     if '%' in url:
-        decoded = urllib.parse.unquote(url)
-        # Fix multiple + signs that get decoded incorrectly
-        # Replace +++ with single +
-        decoded = decoded.replace('+++', ' + ')
-        decoded = decoded.replace('++', ' + ')
-        return decoded
+        # Fix multiple + signs that get decoded incorrectly: +++ and ++
+        # both become a single " + " in one pass
+        return _PLUS_RUN_RE.sub(' + ', urllib.parse.unquote(url))
     return url
 
-def extract_products_from_page(page):
+async def extract_products_from_page(page):
     """Extract all products from current page"""
     products = []
     
     # Wait for products to load
-    page.wait_for_selector('[data-component-type="s-search-result"]', timeout=10000)
+    await page.wait_for_selector(SEL_RESULT, timeout=10000)
     
-    # Get all product containers
-    product_elements = page.query_selector_all('[data-component-type="s-search-result"]')
+    # Get all product fields in a single round-trip
+    rows = await page.evaluate(EXTRACT_JS)
+    
+    # All products of one page share the extraction timestamp
+    scraped_at = datetime.now().isoformat()
+    
+    for row in rows:
+        asin = row['asin']
+        if not asin:
+            continue
+        
+        title = row['title']
+        href = row['href']
+        product_url = urllib.parse.urljoin(_BASE, href) if href else ''
+        
+        # Check if title mentions size-related keywords
+        has_size_info = has_size_keyword(title)
+        
+        product_data = {
+            'asin': asin,
+            'title': title,
+            'price': row['price'],
+            'url': product_url,
+            'has_size_info': has_size_info,
+            'scraped_at': scraped_at
+        }
+        
+        products.append(product_data)
+        
+        # Print with marker for size info
+        marker = "✓" if has_size_info else " "
+        print(f"{marker} {asin}: {title[:60]}...")
+    
+    return products
+
+async def find_next_page_url(page):
+    """Find the URL for the next page"""
+    next_elem = await page.query_selector(NEXT_SEL)
+    if next_elem:
+        href = await next_elem.get_attribute('href')
+        if href:
+            return urllib.parse.urljoin(_BASE, href)
     
-    for product in product_elements:
+    return None
+
+def page_url(next_url, page_num):
+    """Return Amazon's next-page URL rewritten to point at page_num"""
+    parts = urllib.parse.urlsplit(next_url)
+    query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True) if k != 'page']
+    query.append(('page', str(page_num)))
+    return parts._replace(query=urllib.parse.urlencode(query)).geturl()
+
+async def solve_captcha(crawl, page_num):
+    """Pause the whole crawl while the user solves a captcha, one prompt at a time"""
+    async with crawl['captcha_lock']:
+        crawl['running'].clear()
         try:
-            # Extract ASIN
-            asin = product.get_attribute('data-asin')
-            if not asin:
-                continue
+            print(f"⚠️  CAPTCHA detected on page {page_num}! Manual intervention needed.")
+            await asyncio.to_thread(input, "Solve the captcha and press Enter to continue...")
+        finally:
+            crawl['running'].set()
+
+async def fetch_page(slot, crawl, url, page_num, find_next=False):
+    """Load and extract one search page; returns (page_num, products, next_url)"""
+    # One navigation at a time per context, spaced by MIN_PAGE_INTERVAL
+    async with slot['lock']:
+        # Only sleep if the previous page was handled faster than the rate limit
+        remaining = MIN_PAGE_INTERVAL - (time.monotonic() - slot['last_navigation'])
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        # No context hits Amazon while a captcha prompt is open
+        await crawl['running'].wait()
+        slot['last_navigation'] = time.monotonic()
+        
+        page = await slot['context'].new_page()
+        try:
+            print(f"\n📄 Page {page_num}")
+            print(f"URL: {url[:100]}...")
             
-            # Extract title
-            title_elem = product.query_selector('h2 a span')
-            title = title_elem.text_content().strip() if title_elem else ''
+            # extract_products_from_page waits for the results to appear
+            await with_retry(lambda: page.goto(url, wait_until='domcontentloaded', timeout=30000))
             
-            # Extract price
-            price_elem = product.query_selector('.a-price-whole')
-            price = price_elem.text_content().strip() if price_elem else ''
+            # Title, error and captcha checks in one round-trip
+            state = await page.evaluate(PAGE_STATE_JS)
+            print(f"Page {page_num} title: {state['title']}")
             
-            # Extract URL
-            link_elem = product.query_selector('h2 a')
-            href = link_elem.get_attribute('href') if link_elem else ''
-            product_url = f"https://www.amazon.de{href}" if href.startswith('/') else href
+            # Check for error page
+            if state['isError']:
+                print(f"❌ ERROR: Got error page on page {page_num}!")
+                return page_num, [], None
             
-            # Check if title mentions size-related keywords
-            size_keywords = ['größentabelle', 'größe', 'länge', 'breite', 'size', 'chart', 'maße']
-            has_size_info = any(keyword in title.lower() for keyword in size_keywords)
+            # Check for captcha
+            if state['hasCaptcha']:
+                await solve_captcha(crawl, page_num)
             
-            product_data = {
-                'asin': asin,
-                'title': title,
-                'price': price,
-                'url': product_url,
-                'has_size_info': has_size_info,
-                'scraped_at': datetime.now().isoformat()
-            }
+            # Extract products
+            products = await extract_products_from_page(page)
             
-            products.append(product_data)
+            print(f"\nFound {len(products)} products on page {page_num}")
+            print(f"Products with size info: {sum(1 for p in products if p['has_size_info'])}")
             
-            # Print with marker for size info
-            marker = "✓" if has_size_info else " "
-            print(f"{marker} {asin}: {title[:60]}...")
+            next_url = await find_next_page_url(page) if find_next and products else None
+            return page_num, products, next_url
             
         except Exception as e:
-            print(f"Error extracting product: {e}")
-            continue
-    
-    return products
+            print(f"❌ Error on page {page_num}: {e}")
+            return page_num, [], None
+        finally:
+            await page.close()
 
-def find_next_page_url(page):
-    """Find the URL for the next page"""
-    try:
-        # Look for "Weiter" (Next) button
-        next_buttons = [
-            'a.s-pagination-next:not(.s-pagination-disabled)',
-            'a:has-text("Weiter")',
-            '.s-pagination-strip a.s-pagination-next'
-        ]
-        
-        for selector in next_buttons:
-            next_elem = page.query_selector(selector)
-            if next_elem:
-                href = next_elem.get_attribute('href')
-                if href:
-                    if href.startswith('/'):
-                        return f"https://www.amazon.de{href}"
-                    return href
-        
-        return None
-    except:
-        return None
-
-def crawl_amazon_search(start_url, max_pages=5):
+async def crawl_amazon_search(start_url, max_pages=5):
     """Main crawler function"""
     # IMPORTANT: Decode the URL first!
     decoded_url = decode_url(start_url)
@@ -109,75 +196,54 @@ def crawl_amazon_search(start_url, max_pages=5):
     
     all_products = []
     
-    with Camoufox(headless=False, humanize=True) as browser:
-        page = browser.new_page()
-        current_url = decoded_url
+    # Start a fresh output file, pages are appended in page order
+    open(OUTPUT_FILE, 'w').close()
+    
+    async with AsyncCamoufox(headless=False, humanize=True) as browser:
+        slots = [
+            {'context': await browser.new_context(), 'lock': asyncio.Lock(), 'last_navigation': 0.0}
+            for _ in range(MAX_CONTEXTS)
+        ]
+        # Only the DOM is read, so skip images, fonts and the like
+        for slot in slots:
+            await block_resources(slot['context'])
         
-        for page_num in range(1, max_pages + 1):
-            print(f"\n📄 Page {page_num}")
-            print(f"URL: {current_url[:100]}...")
+        # Shared by all contexts: a captcha anywhere pauses every one of them
+        crawl = {'running': asyncio.Event(), 'captcha_lock': asyncio.Lock()}
+        crawl['running'].set()
+        
+        # Page 1 comes first, its pagination strip tells us the other page URLs
+        _, products, next_url = await fetch_page(slots[0], crawl, decoded_url, 1, find_next=max_pages > 1)
+        all_products.extend(products)
+        save_products(products)
+        
+        if next_url:
+            # Pages 2..N are independent, fetch them across all contexts
+            urls = [(page_num, page_url(next_url, page_num)) for page_num in range(2, max_pages + 1)]
+            results = await asyncio.gather(*(
+                fetch_page(slots[i % len(slots)], crawl, url, page_num)
+                for i, (page_num, url) in enumerate(urls)
+            ))
             
-            # Navigate to page
-            try:
-                page.goto(current_url, wait_until='domcontentloaded', timeout=30000)
-                time.sleep(3)  # Let page settle
-                
-                # Check title
-                title = page.title()
-                print(f"Page title: {title}")
-                
-                # Check for error page
-                if "Tut uns Leid" in title or "Sorry" in title:
-                    print("❌ ERROR: Got error page! Stopping.")
-                    break
-                
-                # Check for captcha
-                if page.query_selector('#captchacharacters'):
-                    print("⚠️  CAPTCHA detected! Manual intervention needed.")
-                    input("Solve the captcha and press Enter to continue...")
-                
-                # Extract products
-                print("\nExtracting products...")
-                products = extract_products_from_page(page)
-                
-                if not products:
-                    print("No products found on this page.")
-                    break
-                
-                print(f"\nFound {len(products)} products on page {page_num}")
-                print(f"Products with size info: {sum(1 for p in products if p['has_size_info'])}")
-                
+            # Pages finish in any order, write them in page order
+            for page_num, products, _ in sorted(results, key=lambda r: r[0]):
                 all_products.extend(products)
-                
-                # Save after each page
-                save_products(all_products)
-                
-                # Check for next page
-                if page_num < max_pages:
-                    next_url = find_next_page_url(page)
-                    if next_url:
-                        print(f"\nNext page URL found: {next_url[:80]}...")
-                        current_url = next_url
-                        time.sleep(5)  # Rate limit between pages
-                    else:
-                        print("\nNo next page found.")
-                        break
-                
-            except Exception as e:
-                print(f"❌ Error on page {page_num}: {e}")
-                break
+                save_products(products)
+        elif max_pages > 1:
+            print("\nNo next page found.")
     
     # Final summary
     print("\n" + "="*80)
     print(f"✅ Crawling completed!")
     print(f"Total products collected: {len(all_products)}")
     print(f"Products with size info: {sum(1 for p in all_products if p['has_size_info'])}")
-    print(f"Results saved to: amazon-products.json")
+    print(f"Results saved to: {OUTPUT_FILE}")
 
-def save_products(products):
-    """Save products to JSON file"""
-    with open('amazon-products.json', 'w', encoding='utf-8') as f:
-        json.dump(products, f, ensure_ascii=False, indent=2)
+def save_products(new_products):
+    """Append products to the JSON Lines output file"""
+    with open(OUTPUT_FILE, 'ab') as f:
+        for product in new_products:
+            f.write(orjson.dumps(product, option=orjson.OPT_APPEND_NEWLINE))
 
 if __name__ == '__main__':
     # Your exact URL
@@ -186,4 +252,4 @@ if __name__ == '__main__':
     url = sys.argv[1] if len(sys.argv) > 1 else default_url
     max_pages = int(sys.argv[2]) if len(sys.argv) > 2 else 3
     
-    crawl_amazon_search(url, max_pages)
\ No newline at end of file
+    asyncio.run(crawl_amazon_search(url, max_pages))
\ No newline at end of file